@@ -0,0 +1,240 @@
+"""Tool descriptions advertised by the Service Anniversary MCP server."""
+
+SEARCH_DESC = """\
+Search for upcoming service anniversary celebrations based on criteria.
+
+Results are paginated with an opaque cursor: pass metadata.nextCursor
+from the previous response as pagination.cursor to fetch the next page.
+At most 100 celebrations are returned per page (10 when limit is
+omitted); metadata.nextCursor is null once the last page has been returned.
+Every field is optional: omitted strings default to "" and an omitted
+section uses its defaults.
+
+JSON Schema for 'query' parameter:
+{
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "object",
+            "properties": {
+                "search": {
+                    "type": "object",
+                    "properties": {
+                        "by": { "type": "string", "enum": ["email", "name"] },
+                        "identifier": { "type": "string" }
+                    }
+                },
+                "filters": {
+                    "type": "object",
+                    "properties": {
+                        "team": { "type": "string", "enum": ["my_team", "other_teams", "all"] },
+                        "timePeriod": { "type": "string", "enum": ["future", "past"] },
+                        "notBeforeDate": { "type": "string", "format": "date" },
+                        "notAfterDate": { "type": "string", "format": "date" }
+                    }
+                },
+                "pagination": {
+                    "type": "object",
+                    "properties": {
+                        "limit": { "type": "integer", "minimum": 1, "maximum": 100, "default": 10 },
+                        "cursor": { "type": "string", "description": "Opaque token from metadata.nextCursor; omit for the first page" }
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+GET_FULL_NAME_DESC = """\
+Get the full name of a person given their first and last names.
+
+args:
+    first_name (str): The first name of the person.
+    last_name (str): The last name of the person.
+
+returns:
+    str: The full name of the person in the format "First Last".
+
+example:
+    Input:
+    first_name: "John"
+    last_name: "Doe"
+
+    Output:
+    "John Doe"
+"""
+
+GET_PERSONAL_DETAILS_DESC = """\
+Get the personal details of a person given their first and last names, email address and company name.
+
+args:
+    first_name (str): The first name of the person.
+    last_name (str): The last name of the person.
+    email_address (str): The email address of the person.
+    company_name (str): The company the person works for.
+
+returns:
+    dict: {
+        "firstName": "string",
+        "lastName": "string",
+        "emailAddress": "string",
+        "fullName": "string",
+        "company_name": "string"
+    }
+
+example:
+    Input:
+    first_name: "John"
+    last_name: "Doe"
+    email_address: "john.doe@example.com"
+    company_name: "example.Inc"
+
+    Output:
+    {
+        "firstName": "John",
+        "lastName": "Doe",
+        "emailAddress": "john.doe@example.com",
+        "fullName": "John Doe",
+        "company_name": "example.Inc"
+    }
+"""
+
+CELEBRATION_CONTRIBUTIONS_DESC = """\
+Retrieve comments and replies contributed to a specific celebration.
+
+Comments are paginated with an opaque cursor: pass metadata.nextCursor
+from the previous response as cursor to fetch the next page.
+metadata.nextCursor is null once the last page has been returned. A UUID
+cursor, as issued by earlier versions, is treated as the first page.
+
+args:
+    query (dict): {
+        "celebrationId": "uuid",
+        "cursor": "string"
+    }
+
+returns:
+    dict: {
+        "celebration": {...},
+        "comments": [...],
+        "metadata": {"totalComments": int, "nextCursor": "string" | null}
+    }
+
+example:
+    Input:
+    {
+        "celebrationId": "123e4567-e89b-12d3-a456-426614174000",
+        "cursor": ""
+    }
+
+    Output:
+    {
+        "celebration": {...},
+        "comments": [...],
+        "metadata": {"totalComments": 1, "nextCursor": null}
+    }
+"""
+
+COMMENT_DESC = """\
+Add or reply to a comment on a celebration.
+
+args:
+    query (dict): {
+        "celebrationId": "uuid",
+        "commentId": "uuid",
+        "comment": "string",
+        "isPrivate": bool
+    }
+
+returns:
+    dict: {
+        "celebration": {...},
+        "comment": {...}
+    }
+
+example:
+    Input:
+    {
+        "celebrationId": "123e4567-e89b-12d3-a456-426614174000",
+        "commentId": "11111111-2222-3333-4444-555555555555",
+        "comment": "Congratulations!",
+        "isPrivate": false
+    }
+
+    Output:
+    {
+        "celebration": {...},
+        "comment": {
+            "commentId": "uuid",
+            "isPrivate": false,
+            "totalLikes": 0,
+            "comment": "Congratulations!",
+            "contributor": {...}
+        }
+    }
+"""
+
+INVITE_DESC = """\
+Invite contributors (internal or external) to a celebration.
+
+args:
+    query (dict): {
+        "celebrationId": "uuid",
+        "byRosterPersonId": [{"rosterPersonId": "uuid"}],
+        "byEmailAddress": [{"emailAddress": "string", "firstName": "string", "lastName": "string"}]
+    }
+
+returns:
+    dict: {
+        "celebration": {...},
+        "invitationSummary": {"invitesSent": int, "alreadyInvited": int},
+        "invitedContributors": [...],
+        "suggestedInvitees": [...]
+    }
+
+example:
+    Input:
+    {
+        "celebrationId": "123e4567-e89b-12d3-a456-426614174000",
+        "byRosterPersonId": [{"rosterPersonId": "uuid"}],
+        "byEmailAddress": [{"emailAddress": "abc@example.com", "firstName": "Amit", "lastName": "Kumar"}]
+    }
+
+    Output:
+    {
+        "celebration": {...},
+        "invitationSummary": {"invitesSent": 2, "alreadyInvited": 1},
+        "invitedContributors": [...],
+        "suggestedInvitees": [...]
+    }
+"""
+
+FIND_INVITEES_DESC = """\
+Search for internal people to invite to a celebration.
+
+args:
+    query (dict): {
+        "search": {"by": "name"|"email", "query": "string (at most 256 characters)"},
+        "celebrationId": "uuid"
+    }
+
+returns:
+    dict: {
+        "people": [...],
+        "metadata": {"totalResults": int}
+    }
+
+example:
+    Input:
+    {
+        "search": {"by": "name", "query": "John"},
+        "celebrationId": "123e4567-e89b-12d3-a456-426614174000"
+    }
+
+    Output:
+    {
+        "people": [...],
+        "metadata": {"totalResults": 5}
+    }
+"""
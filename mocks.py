@@ -0,0 +1,205 @@
+"""Mock data helpers for the Service Anniversary MCP server.
+
+Records are returned as plain dicts: FastMCP hands tool results to the MCP
+layer as structured content and to the tool serializer as-is, and both only
+accept JSON-native types.
+
+Two kinds of data are shared between requests:
+
+- Templates and the per-index cached fields (_person_static,
+  _celebration_static) are read-only mappings that callers copy before
+  filling in. The copy is shallow, so the nested thankYouMessage dict is
+  shared by every copy.
+- Constant records (_CONTRIBUTOR_JOHN, _CONTRIBUTOR_MADAN,
+  _INVITED_CONTRIBUTORS, _SUGGESTED_INVITEES, _CELEBRATION_1 and the
+  _cached_person_search results) are plain dicts embedded in responses
+  without copying.
+
+Neither kind may be mutated.
+"""
+import functools
+import os
+import uuid
+from datetime import date, datetime, timezone
+from types import MappingProxyType
+
+__all__ = [
+    "_CONTRIBUTOR_JOHN",
+    "_CONTRIBUTOR_MADAN",
+    "_uuid_str_batch",
+    "_mock_person",
+    "_mock_celebration",
+    "_mock_celebrations",
+    "_mock_person_search",
+    "_cached_person_search",
+    "_INVITED_CONTRIBUTORS",
+    "_SUGGESTED_INVITEES",
+    "_CELEBRATION_1",
+]
+
+_PERSON_TEMPLATE = MappingProxyType({
+    "rosterPersonId": None,
+    "firstName": None,
+    "lastName": "Example",
+    "emailAddress": None,
+    "avatarUrl": "https://example.com/avatar.png",
+    "jobTitle": "Software Engineer",
+    "isInMyTeam": None
+})
+
+_THANK_YOU_TEMPLATE = MappingProxyType({
+    "comment": "Thanks team!",
+    "totalLikes": None
+})
+
+_CELEBRATION_TEMPLATE = MappingProxyType({
+    "celebrationId": None,
+    "milestoneName": None,
+    "date": None,
+    "imageUrl": "https://example.com/milestone.png",
+    "totalInvites": None,
+    "canContribute": True,
+    "hasContributed": None,
+    "hasCelebratorThanked": None,
+    "allowPrivateComments": True,
+    "thankYouMessage": None,
+    "celebrator": None
+})
+
+def _uuid_str_batch(k: int) -> list:
+    """Generate k random UUID4 strings from a single os.urandom call."""
+    b = bytearray(os.urandom(16 * k))
+    out = []
+    for o in range(0, 16 * k, 16):
+        b[o + 6] = (b[o + 6] & 0x0f) | 0x40
+        b[o + 8] = (b[o + 8] & 0x3f) | 0x80
+        h = b[o:o + 16].hex()
+        out.append(f"{h[0:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}")
+    return out
+
+# Ids of mock records are derived from a fixed key rather than drawn at
+# random, so every worker process serves the same id for the same record.
+_MOCK_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "urn:service-anniversary-mcp:mock")
+
+def _mock_id(key: str) -> str:
+    """Derive the stable UUID string of the mock record named by key."""
+    return str(uuid.uuid5(_MOCK_ID_NAMESPACE, key))
+
+# Static people and invitees shared by every response (do not mutate).
+_CONTRIBUTOR_JOHN = {
+    "rosterPersonId": _mock_id("contributor/john.doe"),
+    "firstName": "John",
+    "lastName": "Doe",
+    "emailAddress": "john.doe@example.com",
+    "avatarUrl": "https://example.com/john.png",
+    "jobTitle": "Engineer",
+    "isCurrentUser": False
+}
+
+_CONTRIBUTOR_MADAN = {
+    "rosterPersonId": _mock_id("contributor/madan.shetty"),
+    "firstName": "Madan",
+    "lastName": "Shetty",
+    "emailAddress": "madan.shetty@example.com",
+    "avatarUrl": "https://example.com/avatar_madan.png",
+    "jobTitle": "Software Engineer",
+    "isCurrentUser": True
+}
+
+_INVITED_CONTRIBUTORS = (
+    {"emailAddress": "jane.doe@example.com", "firstName": "Jane", "lastName": "Doe"},
+    {"emailAddress": "john.smith@example.com", "firstName": "John", "lastName": "Smith"}
+)
+
+_SUGGESTED_INVITEES = tuple(
+    {"rosterPersonId": _mock_id(f"invitee/{first}.{last}"), "firstName": first, "lastName": last}
+    for first, last in (("Amit", "Kumar"), ("Priya", "Sharma"))
+)
+
+def _mock_dates(start: int, limit: int, now: datetime) -> list:
+    """Generate the weekly celebration dates for indices start..start+limit-1.
+
+    Every date shares now's time of day, so only the day ordinal changes and
+    the ISO time suffix is formatted once per page.
+    """
+    ordinal = now.toordinal()
+    suffix = now.isoformat()[10:]
+    from_ordinal = date.fromordinal
+    return [from_ordinal(ordinal + 7 * i).isoformat() + suffix for i in range(start, start + limit)]
+
+@functools.lru_cache(maxsize=1024)
+def _person_static(i: int) -> MappingProxyType:
+    """Build the read-only fields of mock person i, including a stable id."""
+    d = _PERSON_TEMPLATE.copy()
+    d["rosterPersonId"] = _mock_id(f"person/{i}")
+    d["firstName"] = f"User{i}"
+    d["emailAddress"] = f"user{i}@example.com"
+    d["isInMyTeam"] = not (i & 1)
+    return MappingProxyType(d)
+
+def _mock_person(i: int) -> dict:
+    """Generate mock person details for demonstration."""
+    return _person_static(i).copy()
+
+@functools.lru_cache(maxsize=1024)
+def _celebration_static(i: int) -> MappingProxyType:
+    """Build the read-only fields of mock celebration i, including a stable id."""
+    thank_you = _THANK_YOU_TEMPLATE.copy()
+    thank_you["totalLikes"] = i
+    d = _CELEBRATION_TEMPLATE.copy()
+    d["celebrationId"] = _mock_id(f"celebration/{i}")
+    d["milestoneName"] = f"Service Anniversary {i}"
+    d["totalInvites"] = 5 + i
+    d["hasContributed"] = not (i & 1)
+    d["hasCelebratorThanked"] = (i % 3 == 0)
+    d["thankYouMessage"] = thank_you
+    return MappingProxyType(d)
+
+def _mock_celebration(i: int) -> dict:
+    """Generate mock celebration details for demonstration."""
+    d = _celebration_static(i).copy()
+    d["date"] = _mock_dates(i, 1, datetime.now(timezone.utc))[0]
+    d["celebrator"] = _mock_person(i)
+    return d
+
+def _mock_celebrations(start: int, limit: int) -> list:
+    """Generate a page of mock celebrations for indices start..start+limit-1.
+
+    Records (ids included) are cached per index, so overlapping pages reuse
+    them across requests; only the dates are computed per page.
+    """
+    dates = _mock_dates(start, limit, datetime.now(timezone.utc))
+    celebrations = [None] * limit
+    for k, i in enumerate(range(start, start + limit)):
+        d = _celebration_static(i).copy()
+        d["date"] = dates[k]
+        d["celebrator"] = _person_static(i).copy()
+        celebrations[k] = d
+    return celebrations
+
+def _mock_person_search(query: str, limit: int = 5):
+    """Generate mock person search results."""
+    first = query.capitalize()
+    local = query.lower()
+    results = [None] * limit
+    for i in range(limit):
+        j = i + 1
+        results[i] = {
+            "rosterPersonId": _mock_id(f"search/{local}/{j}"),
+            "firstName": f"{first}_{j}",
+            "lastName": "Example",
+            "emailAddress": f"{local}{j}@example.com",
+            "avatarUrl": "https://example.com/avatar.png",
+            "jobTitle": "Software Engineer",
+            "isCurrentUser": False
+        }
+    return results
+
+@functools.lru_cache(maxsize=1024)
+def _cached_person_search(query: str, limit: int = 5) -> tuple:
+    """Cached _mock_person_search keyed on the lower-cased query (shared, do not mutate)."""
+    return tuple(_mock_person_search(query, limit))
+
+# The celebration echoed back by the contribution/comment/invite tools; built
+# once at import (shared, do not mutate).
+_CELEBRATION_1 = _mock_celebration(1)
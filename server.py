@@ -1,245 +1,277 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
 import uuid
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime
+import pydantic_core
+import uvicorn
 from fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from fastmcp.tools.tool import ToolResult
+from mcp.types import TextContent
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+try:
+    import orjson
+except ImportError:  # optional; FastMCP falls back to pydantic-core
+    orjson = None
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from descriptions import (
+    SEARCH_DESC,
+    GET_FULL_NAME_DESC,
+    GET_PERSONAL_DETAILS_DESC,
+    CELEBRATION_CONTRIBUTIONS_DESC,
+    COMMENT_DESC,
+    INVITE_DESC,
+    FIND_INVITEES_DESC,
+)
+from mocks import (
+    _CONTRIBUTOR_JOHN,
+    _CONTRIBUTOR_MADAN,
+    _mock_celebrations,
+    _cached_person_search,
+    _uuid_str_batch,
+    _INVITED_CONTRIBUTORS,
+    _SUGGESTED_INVITEES,
+    _CELEBRATION_1,
+)
 
 # ===================================================
 # FastMCP Server Setup
 # ===================================================
-mcp = FastMCP("Service_Anniversary_MCP_Server")
+def _dumps(data) -> str:
+    """Serialize a tool result to JSON text, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return pydantic_core.to_json(data, fallback=str).decode()
+
+def _loads(raw: bytes):
+    """Parse JSON bytes, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_result(data: dict, text: str = None) -> ToolResult:
+    """Return a tool response pre-serialized as text alongside its structured form.
+
+    Pass text when the caller already rendered data (e.g. by splicing
+    pre-serialized fragments) so it is not serialized again.
+    """
+    return ToolResult(
+        content=[TextContent(type="text", text=text or _dumps(data))],
+        structured_content=data
+    )
+
+class InvalidArgumentError(ValueError):
+    """A tool argument that passed schema validation but cannot be used (bad cursor or date)."""
+
+def create_server() -> FastMCP:
+    """Create the FastMCP server with all tools registered."""
+    mcp = FastMCP(
+        "Service_Anniversary_MCP_Server",
+        tool_serializer=_dumps
+    )
+    return register_tools(mcp)
 
 # ===================================================
-# MOCK HELPERS
+# PAGINATION HELPERS
 # ===================================================
-def _mock_person(i: int) -> dict:
-    """Generate mock person details for demonstration."""
-    return {
-        "rosterPersonId": str(uuid.uuid4()),
-        "firstName": f"User{i}",
-        "lastName": "Example",
-        "emailAddress": f"user{i}@example.com",
-        "avatarUrl": "https://example.com/avatar.png",
-        "jobTitle": "Software Engineer",
-        "isInMyTeam": (i % 2 == 0)
-    }
+_MAX_PAGE_SIZE = 100
+_TOTAL_CELEBRATIONS = 100
+_TOTAL_COMMENTS = 1
+
+_CURSOR_SECRET = os.environ.get("MCP_CURSOR_SECRET", "").encode() or os.urandom(32)
+_CURSOR_SIG_SIZE = 8
+
+def _encode_cursor(tool: str, payload: dict) -> str:
+    """Serialize a tool's pagination position into an opaque, signed URL-safe token."""
+    raw = json.dumps({"tool": tool, **payload}, separators=(",", ":")).encode()
+    sig = hmac.new(_CURSOR_SECRET, raw, hashlib.sha256).digest()[:_CURSOR_SIG_SIZE]
+    return base64.urlsafe_b64encode(sig + raw).decode()
+
+def _decode_cursor(tool: str, token: str) -> dict:
+    """Verify and deserialize a token _encode_cursor issued for tool; empty means first page."""
+    if not token:
+        return {}
+    try:
+        blob = base64.urlsafe_b64decode(token.encode())
+        sig, raw = blob[:_CURSOR_SIG_SIZE], blob[_CURSOR_SIG_SIZE:]
+        expected = hmac.new(_CURSOR_SECRET, raw, hashlib.sha256).digest()[:_CURSOR_SIG_SIZE]
+        payload = json.loads(raw) if hmac.compare_digest(sig, expected) else None
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict) or payload.pop("tool", None) != tool:
+        raise InvalidArgumentError(f"Invalid pagination cursor: {token!r}")
+    return payload
+
+def _is_uuid(s: str) -> bool:
+    """Tell whether s parses as a UUID."""
+    try:
+        uuid.UUID(s)
+    except ValueError:
+        return False
+    return True
 
-def _mock_celebration(i: int) -> dict:
-    """Generate mock celebration details for demonstration."""
-    now = datetime.now(timezone.utc)
-    return {
-        "celebrationId": str(uuid.uuid4()),
-        "milestoneName": f"Service Anniversary {i}",
-        "date": (now + timedelta(days=(i * 7))).isoformat(),
-        "imageUrl": "https://example.com/milestone.png",
-        "totalInvites": 5 + i,
-        "canContribute": True,
-        "hasContributed": (i % 2 == 0),
-        "hasCelebratorThanked": (i % 3 == 0),
-        "allowPrivateComments": True,
-        "thankYouMessage": {
-            "comment": "Thanks team!",
-            "totalLikes": i
-        },
-        "celebrator": _mock_person(i)
-    }
-
-def _mock_person_search(query: str, limit: int = 5):
-    """Generate mock person search results."""
-    results = []
-    for i in range(1, limit + 1):
-        results.append({
-            "rosterPersonId": str(uuid.uuid4()),
-            "firstName": f"{query.capitalize()}_{i}",
-            "lastName": "Example",
-            "emailAddress": f"{query.lower()}{i}@example.com",
-            "avatarUrl": "https://example.com/avatar.png",
-            "jobTitle": "Software Engineer",
-            "isCurrentUser": False
-        })
-    return results
+# ===================================================
+# FILTER HELPERS
+# ===================================================
+def _parse_iso_date(s: str) -> date:
+    """Parse an ISO 8601 date, trying the plain YYYY-MM-DD form first."""
+    if len(s) == 10:
+        try:
+            return date.fromisoformat(s)
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(s).date()
+    except ValueError:
+        raise InvalidArgumentError(f"Invalid ISO date: {s!r}")
 
 # ===================================================
-# TOOL IMPLEMENTATIONS
+# TOOL ARGUMENT MODELS
 # ===================================================
+# FastMCP validates tool arguments against these models with pydantic-core
+# before the tool body runs, so tools read typed attributes directly.
 
 class Pagination(BaseModel):
-    limit: int = Field("limit")
-    cursor: int = Field("cursor")
+    model_config = ConfigDict(frozen=True)
+    limit: int = Field(10, ge=1)
+    cursor: str = Field("")
 
 class Filters(BaseModel):
-    team: str = Field()
-    timePeriod: str = Field()
-    notBeforeDate: str = Field()
-    notAfterDate: str = Field()
+    model_config = ConfigDict(frozen=True)
+    team: str = Field("")
+    timePeriod: str = Field("")
+    notBeforeDate: str = Field("")
+    notAfterDate: str = Field("")
 
 class Search(BaseModel):
-    by: str = Field()
-    identifier: str = Field()
+    model_config = ConfigDict(frozen=True)
+    by: str = Field("")
+    identifier: str = Field("")
+
+# Omitted sections share one default instance. The models are frozen, so
+# pydantic reuses it as-is instead of building a fresh one per request.
+_DEFAULT_SEARCH = Search()
+_DEFAULT_PAGINATION = Pagination()
+_DEFAULT_FILTERS = Filters()
 
 class QueryFields(BaseModel):
-    search: Search = Field(default_factory=Search)
-    pagination: Pagination = Field(default_factory=Pagination)
-    filters: Filters = Field(default_factory=Filters)
+    model_config = ConfigDict(frozen=True)
+    search: Search = Field(_DEFAULT_SEARCH)
+    pagination: Pagination = Field(_DEFAULT_PAGINATION)
+    filters: Filters = Field(_DEFAULT_FILTERS)
+
+_DEFAULT_QUERY_FIELDS = QueryFields()
 
 class Query(BaseModel):
-    query: QueryFields = Field(default_factory=QueryFields,description="query felds")
+    query: QueryFields = Field(_DEFAULT_QUERY_FIELDS, description="query fields")
 
-@mcp.tool(name="search")
-def search(query: Query) -> dict:
-    """
-    Search for upcoming service anniversary celebrations based on criteria.
-        JSON Schema for 'query' parameter:
-        {
-        "type": "object",
-        "properties": {
-            "query": {
-            "type": "object",
-            "properties": {
-                "search": {
-                "type": "object",
-                "properties": {
-                    "by": { "type": "string", "enum": ["email", "name"] },
-                    "identifier": { "type": "string" }
-                },
-                "required": ["by", "identifier"]
-                },
-                "filters": {
-                "type": "object",
-                "properties": {
-                    "team": { "type": "string", "enum": ["my_team", "other_teams", "all"] },
-                    "timePeriod": { "type": "string", "enum": ["future", "past"] },
-                    "notBeforeDate": { "type": "string", "format": "date" },
-                    "notAfterDate": { "type": "string", "format": "date" }
-                }
-                },
-                "pagination": {
-                "type": "object",
-                "properties": {
-                    "limit": { "type": "integer" },
-                    "cursor": { "type": "integer" }
-                }
-                }
-            },
-            "required": ["search"]
-            }
-        },
-        "required": ["query"]
-        }
-    """
+class ContributionsQuery(BaseModel):
+    celebrationId: str = Field("")
+    cursor: str = Field("")
 
-    limit = query.query.pagination.limit
-    cursor = query.query.pagination.cursor
-
-    celebrations = [_mock_celebration(i + cursor + 1) for i in range(limit)]
-    metadata = {"total": 100, "nextCursor": cursor + limit}
-
-    return {"celebrations": celebrations, "metadata": metadata}
-
-@mcp.tool(
-    name="get_full_name", description="""
-    Get the full name of a person given their first and last names.
-    args:
-        first_name (str): The first name of the person.
-        last_name (str): The last name of the person.
-        returns:
-        str: The full name of the person in the format "First Last".
-    example:
-        Input:
-        first_name: "John"
-        last_name: "Doe"
-        Output:
-        "John Doe"
-    """)
-def get_full_name(first_name: str, last_name: str) -> str:
+class CommentQuery(BaseModel):
+    celebrationId: str = Field("")
+    commentId: str = Field("")
+    comment: str = Field("")
+    isPrivate: bool = Field(False)
+
+class RosterPersonRef(BaseModel):
+    rosterPersonId: str = Field()
+
+class EmailInvitee(BaseModel):
+    emailAddress: str = Field()
+    firstName: str = Field("")
+    lastName: str = Field("")
+
+class InviteQuery(BaseModel):
+    celebrationId: str = Field("")
+    byRosterPersonId: list[RosterPersonRef] = Field(default_factory=list)
+    byEmailAddress: list[EmailInvitee] = Field(default_factory=list)
+
+class InviteeSearch(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    by: str = Field("name")
+    # Bounded because results are cached per query string.
+    query: str = Field("", max_length=256)
+
+_DEFAULT_INVITEE_SEARCH = InviteeSearch()
+
+class FindInviteesQuery(BaseModel):
+    search: InviteeSearch = Field(_DEFAULT_INVITEE_SEARCH)
+    celebrationId: str = Field("")
+
+# ===================================================
+# PRE-SERIALIZED FRAGMENTS
+# ===================================================
+# Constant parts of responses, rendered once at import and spliced into the
+# text of each response instead of being re-encoded per request.
+_CELEBRATION_1_JSON = _dumps(_CELEBRATION_1)
+
+_INVITE_RESPONSE = {
+    "celebration": _CELEBRATION_1,
+    "invitationSummary": {"invitesSent": 2, "alreadyInvited": 1},
+    "invitedContributors": list(_INVITED_CONTRIBUTORS),
+    "suggestedInvitees": list(_SUGGESTED_INVITEES)
+}
+_INVITE_JSON = _dumps(_INVITE_RESPONSE)
+
+# ===================================================
+# TOOL IMPLEMENTATIONS
+# ===================================================
+def search(query: Query) -> ToolResult:
+    fields = query.query
+    filters, pagination = fields.filters, fields.pagination
+
+    not_before = _parse_iso_date(filters.notBeforeDate) if filters.notBeforeDate else None
+    not_after = _parse_iso_date(filters.notAfterDate) if filters.notAfterDate else None
+    if not_before and not_after and not_before > not_after:
+        raise InvalidArgumentError("filters.notBeforeDate must not be after filters.notAfterDate")
+
+    # Keyset pagination: the cursor carries the sort key of the last record
+    # served, and the next page starts strictly after it.
+    after = _decode_cursor("search", pagination.cursor).get("afterIdx", 0)
+    limit = min(pagination.limit, _MAX_PAGE_SIZE, _TOTAL_CELEBRATIONS - after)
+
+    celebrations = _mock_celebrations(after + 1, limit)
+    next_cursor = None
+    if celebrations and after + limit < _TOTAL_CELEBRATIONS:
+        next_cursor = _encode_cursor("search", {"afterIdx": after + limit})
+    metadata = {"total": _TOTAL_CELEBRATIONS, "nextCursor": next_cursor}
+
+    return _json_result({"celebrations": celebrations, "metadata": metadata})
+
+def _full_name(first_name: str, last_name: str) -> str:
+    """Join first and last names; shared by the tools and HTTP routes."""
     return f"{first_name} {last_name}"
 
-@mcp.tool()    
-def get_personal_details(first_name: str, last_name: str, email_address: str, company_name: str ) -> dict:
-    """
-    Get the personal details of a person given their first and last names, email address and company name.
-          args: 
-          first_name (str): The first name of the person.
-          last_name (str): The last name of the person.
-          email_address (str): The email address of the person.
-          returns:
-          dict: A dictionary containing the personal details of the person.
-              {
-                  "firstName": "string",
-                  "lastName": "string",
-                  "emailAddress": "string",
-                  "fullName": "string",
-                    "company_name": "string"
-              }
-          example:
-              Input:
-              first_name: "John"
-              last_name: "Doe"
-              email_address: "john.doe@example.com"
-            company_name: "example.Inc"
-                Output:
-                {
-                    "firstName": "John",
-                    "lastName": "Doe",
-                    "emailAddress": "john.doe@exampl.com",
-                    "fullName": "John Doe",
-                    "company_name": "example.Inc"
-                }
-    """
-    full_name = get_full_name(first_name, last_name)
+def get_full_name(first_name: str, last_name: str) -> str:
+    return _full_name(first_name, last_name)
+
+def get_personal_details(first_name: str, last_name: str, email_address: str, company_name: str) -> dict:
+    full_name = _full_name(first_name, last_name)
     return {
         "firstName": first_name,
         "lastName": last_name,
         "emailAddress": email_address,
         "fullName": full_name,
         "company_name": company_name
-    }   
-
-@mcp.tool(
-    name="celebration_contributions",
-    description="""
-    Retrieve comments and replies contributed to a specific celebration.
-
-    args:
-        query (dict): {
-            "celebrationId": "uuid",
-            "cursor": "uuid"
-        }
-
-    returns:
-        dict: {
-            "celebration": {...},
-            "comments": [...],
-            "metadata": {"totalComments": int, "nextCursor": "uuid"}
-        }
-
-    example:
-        Input:
-        {
-            "celebrationId": "123e4567-e89b-12d3-a456-426614174000",
-            "cursor": "00000000-0000-0000-0000-000000000000"
-        }
-
-        Output:
-        {
-            "celebration": {...},
-            "comments": [...],
-            "metadata": {"totalComments": 1, "nextCursor": "uuid"}
-        }
-    """
-)
-def celebration_contributions(query: dict) -> dict:
-    celebration = _mock_celebration(1)
-    contributor = {
-        "rosterPersonId": str(uuid.uuid4()),
-        "firstName": "John",
-        "lastName": "Doe",
-        "emailAddress": "john.doe@example.com",
-        "avatarUrl": "https://example.com/john.png",
-        "jobTitle": "Engineer",
-        "isCurrentUser": False
     }
+
+def celebration_contributions(query: ContributionsQuery) -> ToolResult:
+    # Cursors were random UUIDs before they were signed and never selected a
+    # page, so such a cursor still means the first page.
+    token = "" if _is_uuid(query.cursor) else query.cursor
+    row = _decode_cursor("celebration_contributions", token).get("commentRowId", 0)
+    celebration = _CELEBRATION_1
+    reply_id, comment_id = _uuid_str_batch(2)
+    contributor = _CONTRIBUTOR_JOHN
     replies = [{
-        "commentId": str(uuid.uuid4()),
+        "commentId": reply_id,
         "isPrivate": False,
         "totalLikes": 1,
         "comment": "Nice work!",
@@ -247,180 +279,164 @@ def celebration_contributions(query: dict) -> dict:
         "replies": []
     }]
     comments = [{
-        "commentId": str(uuid.uuid4()),
+        "commentId": comment_id,
         "isPrivate": False,
         "totalLikes": 5,
         "comment": "Congratulations on your milestone!",
         "contributor": contributor,
         "replies": replies
-    }]
-    metadata = {"totalComments": len(comments), "nextCursor": str(uuid.uuid4())}
-
-    return {"celebration": celebration, "comments": comments, "metadata": metadata}
-
-
-@mcp.tool(
-    name="comment",
-    description="""
-    Add or reply to a comment on a celebration.
-
-    args:
-        query (dict): {
-            "celebrationId": "uuid",
-            "commentId": "uuid",
-            "comment": "string",
-            "isPrivate": bool
-        }
-
-    returns:
-        dict: {
-            "celebration": {...},
-            "comment": {...}
-        }
-
-    example:
-        Input:
-        {
-            "celebrationId": "123e4567-e89b-12d3-a456-426614174000",
-            "commentId": "11111111-2222-3333-4444-555555555555",
-            "comment": "Congratulations!",
-            "isPrivate": false
-        }
-
-        Output:
-        {
-            "celebration": {...},
-            "comment": {
-                "commentId": "uuid",
-                "isPrivate": false,
-                "totalLikes": 0,
-                "comment": "Congratulations!",
-                "contributor": {...}
-            }
-        }
-    """
-)
-def comment(query: dict) -> dict:
-    celebration = _mock_celebration(1)
-    contributor = {
-        "rosterPersonId": str(uuid.uuid4()),
-        "firstName": "Madan",
-        "lastName": "Shetty",
-        "emailAddress": "madan.shetty@example.com",
-        "avatarUrl": "https://example.com/avatar_madan.png",
-        "jobTitle": "Software Engineer",
-        "isCurrentUser": True
-    }
+    }] if row < _TOTAL_COMMENTS else []
+    next_row = row + len(comments)
+    next_cursor = None
+    if next_row < _TOTAL_COMMENTS:
+        next_cursor = _encode_cursor("celebration_contributions", {"commentRowId": next_row})
+    metadata = {"totalComments": _TOTAL_COMMENTS, "nextCursor": next_cursor}
+
+    text = f'{{"celebration":{_CELEBRATION_1_JSON},"comments":{_dumps(comments)},"metadata":{_dumps(metadata)}}}'
+    return _json_result({"celebration": celebration, "comments": comments, "metadata": metadata}, text)
+
+
+def comment(query: CommentQuery) -> ToolResult:
+    celebration = _CELEBRATION_1
+    comment_id = _uuid_str_batch(1)[0]
+    contributor = _CONTRIBUTOR_MADAN
     new_comment = {
-        "commentId": str(uuid.uuid4()),
-        "isPrivate": query.get("isPrivate", False),
+        "commentId": comment_id,
+        "isPrivate": query.isPrivate,
         "totalLikes": 0,
-        "comment": query.get("comment", ""),
+        "comment": query.comment,
         "contributor": contributor
     }
 
-    return {"celebration": celebration, "comment": new_comment}
-
-
-@mcp.tool(
-    name="invite",
-    description="""
-    Invite contributors (internal or external) to a celebration.
-
-    args:
-        query (dict): {
-            "celebrationId": "uuid",
-            "byRosterPersonId": [{"rosterPersonId": "uuid"}],
-            "byEmailAddress": [{"emailAddress": "string", "firstName": "string", "lastName": "string"}]
-        }
-
-    returns:
-        dict: {
-            "celebration": {...},
-            "invitationSummary": {"invitesSent": int, "alreadyInvited": int},
-            "invitedContributors": [...],
-            "suggestedInvitees": [...]
-        }
-
-    example:
-        Input:
-        {
-            "celebrationId": "123e4567-e89b-12d3-a456-426614174000",
-            "byRosterPersonId": [{"rosterPersonId": "uuid"}],
-            "byEmailAddress": [{"emailAddress": "abc@example.com", "firstName": "Amit", "lastName": "Kumar"}]
-        }
-
-        Output:
-        {
-            "celebration": {...},
-            "invitationSummary": {"invitesSent": 2, "alreadyInvited": 1},
-            "invitedContributors": [...],
-            "suggestedInvitees": [...]
-        }
+    text = f'{{"celebration":{_CELEBRATION_1_JSON},"comment":{_dumps(new_comment)}}}'
+    return _json_result({"celebration": celebration, "comment": new_comment}, text)
+
+
+def invite(query: InviteQuery) -> ToolResult:
+    return _json_result(_INVITE_RESPONSE, _INVITE_JSON)
+
+
+def find_invitees(query: FindInviteesQuery) -> ToolResult:
+    people = list(_cached_person_search(query.search.query.lower(), 5))
+    metadata = {"totalResults": len(people)}
+    return _json_result({"people": people, "metadata": metadata})
+
+
+# ===================================================
+# HTTP ROUTES
+# ===================================================
+def _error_response(message: str, details: list = None) -> Response:
+    """Build a 400 JSON error response for a rejected HTTP request."""
+    body = {"error": message}
+    if details is not None:
+        body["details"] = details
+    return Response(_dumps(body), status_code=400, media_type="application/json")
+
+async def _get_full_name_route(request: Request) -> Response:
+    """Plain-HTTP get_full_name that skips MCP session and tool dispatch."""
+    try:
+        body = _loads(await request.body())
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return _error_response("request body must be valid JSON")
+    if not (isinstance(body, dict)
+            and isinstance(body.get("first_name"), str)
+            and isinstance(body.get("last_name"), str)):
+        return _error_response("expected a JSON object with string first_name and last_name")
+    return Response(_dumps(_full_name(body["first_name"], body["last_name"])), media_type="application/json")
+
+def _query_route(tool, model: type[BaseModel]):
+    """Build a plain-HTTP route for a tool taking a single `query` argument.
+
+    The request body is the tool's argument object ({"query": {...}}); it is
+    parsed once and validated straight into the tool's model, and the tool's
+    pre-serialized text is sent back as-is. Malformed requests and the tool's
+    own argument errors are answered with 400; anything else is a server error.
     """
-)
-def invite(query: dict) -> dict:
-    celebration = _mock_celebration(1)
-    summary = {"invitesSent": 2, "alreadyInvited": 1}
-    invited_contributors = [
-        {"emailAddress": "jane.doe@example.com", "firstName": "Jane", "lastName": "Doe"},
-        {"emailAddress": "john.smith@example.com", "firstName": "John", "lastName": "Smith"}
-    ]
-    suggested_invitees = [
-        {"rosterPersonId": str(uuid.uuid4()), "firstName": "Amit", "lastName": "Kumar"},
-        {"rosterPersonId": str(uuid.uuid4()), "firstName": "Priya", "lastName": "Sharma"}
-    ]
-    return {
-        "celebration": celebration,
-        "invitationSummary": summary,
-        "invitedContributors": invited_contributors,
-        "suggestedInvitees": suggested_invitees
-    }
+    async def route(request: Request) -> Response:
+        try:
+            body = _loads(await request.body())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return _error_response("request body must be valid JSON")
+        if not isinstance(body, dict) or "query" not in body:
+            return _error_response('request body must be a JSON object with a "query" field')
+        try:
+            query = model.model_validate(body["query"])
+        except ValidationError as e:
+            return _error_response(
+                "invalid query",
+                e.errors(include_url=False, include_context=False, include_input=False)
+            )
+        try:
+            result = tool(query)
+        except InvalidArgumentError as e:
+            return _error_response(str(e))
+        return Response(result.content[0].text, media_type="application/json")
+    return route
+
 
+# ===================================================
+# TOOL REGISTRATION
+# ===================================================
+def register_tools(mcp: FastMCP) -> FastMCP:
+    """Register every tool on the given server; call once per server.
 
-@mcp.tool(
-    name="find_invitees",
-    description="""
-    Search for internal people to invite to a celebration.
-
-    args:
-        query (dict): {
-            "search": {"by": "name"|"email", "query": "string"},
-            "celebrationId": "uuid"
-        }
-
-    returns:
-        dict: {
-            "people": [...],
-            "metadata": {"totalResults": int}
-        }
-
-    example:
-        Input:
-        {
-            "search": {"by": "name", "query": "John"},
-            "celebrationId": "123e4567-e89b-12d3-a456-426614174000"
-        }
-
-        Output:
-        {
-            "people": [...],
-            "metadata": {"totalResults": 5}
-        }
+    Tools are registered without an output schema so the MCP layer does not
+    re-validate every response we built ourselves against it. get_full_name
+    keeps its default schema: checking one string is free, and the schema is
+    what gives its result a structured form ({"result": "First Last"}).
     """
-)
-def find_invitees(query: dict) -> dict:
-    search_data = query.get("search", {})
-    query_str = search_data.get("query", "")
-    people = _mock_person_search(query_str, 5)
-    metadata = {"totalResults": len(people)}
-    return {"people": people, "metadata": metadata}
+    mcp.tool(search, name="search", description=SEARCH_DESC, output_schema=None)
+    mcp.tool(get_full_name, name="get_full_name", description=GET_FULL_NAME_DESC)
+    mcp.tool(get_personal_details, name="get_personal_details", description=GET_PERSONAL_DETAILS_DESC, output_schema=None)
+    mcp.tool(celebration_contributions, name="celebration_contributions", description=CELEBRATION_CONTRIBUTIONS_DESC, output_schema=None)
+    mcp.tool(comment, name="comment", description=COMMENT_DESC, output_schema=None)
+    mcp.tool(invite, name="invite", description=INVITE_DESC, output_schema=None)
+    mcp.tool(find_invitees, name="find_invitees", description=FIND_INVITEES_DESC, output_schema=None)
+    mcp.custom_route("/get_full_name", methods=["POST"])(_get_full_name_route)
+    mcp.custom_route("/search", methods=["POST"])(_query_route(search, Query))
+    mcp.custom_route("/celebration_contributions", methods=["POST"])(_query_route(celebration_contributions, ContributionsQuery))
+    mcp.custom_route("/comment", methods=["POST"])(_query_route(comment, CommentQuery))
+    mcp.custom_route("/invite", methods=["POST"])(_query_route(invite, InviteQuery))
+    mcp.custom_route("/find_invitees", methods=["POST"])(_query_route(find_invitees, FindInviteesQuery))
+    return mcp
 
 
 # ===================================================
 # RUN SERVER
 # ===================================================
+# Compress HTTP responses over 1 KB. GZipMiddleware skips text/event-stream, so
+# the streamable-http transport answers with plain JSON to let it apply.
+_HTTP_OPTIONS = {
+    "json_response": True,
+    "middleware": [Middleware(GZipMiddleware, minimum_size=1024)]
+}
+
+
+def create_app():
+    """Build the streamable-http ASGI app; the factory behind multi-worker serving.
+
+    Each worker process builds its own server and MCP sessions live in one
+    process only, so the app runs stateless: every request stands alone and
+    may be served by any worker. Cursors must verify on every worker too, so
+    MCP_CURSOR_SECRET is required rather than generated per process.
+    """
+    if not os.environ.get("MCP_CURSOR_SECRET"):
+        raise RuntimeError(
+            "MCP_CURSOR_SECRET must be set: each worker would otherwise sign "
+            "pagination cursors with its own random key"
+        )
+    return create_server().http_app(transport="streamable-http", stateless_http=True, **_HTTP_OPTIONS)
+
+
 if __name__ == "__main__":
-    mcp.run(transport="streamable-http", host="127.0.0.1", port=8080)
-    #mcp.run()  # for local testing
-    #mcp.run(transport="http", host="127.0.0.1", port=8000)
+    # Workers import this module separately; share one cursor key so a cursor
+    # issued by one worker verifies on the others.
+    os.environ.setdefault("MCP_CURSOR_SECRET", os.urandom(32).hex())
+    uvicorn.run(
+        "server:create_app",
+        factory=True,
+        host="127.0.0.1",
+        port=8080,
+        workers=int(os.environ.get("MCP_WORKERS", 0)) or os.cpu_count(),
+        log_level="warning"
+    )